@@ -1,4 +1,8 @@
+#include <algorithm>
+#include <cstdint>
 #include <iostream>
+#include <map>
+#include <stdexcept>
 #include <vector>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
@@ -75,6 +79,72 @@ struct PolyGroup {
     PolygonSet ps_;
 };
 
+typedef py::array_t<int64_t, py::array::c_style | py::array::forcecast> IntArray;
+
+// Copies a vector into a new 1D numpy array
+static IntArray toIntArray(const std::vector<int64_t> &vec) {
+    IntArray arr(static_cast<py::ssize_t>(vec.size()));
+    std::copy(vec.begin(), vec.end(), arr.mutable_data());
+    return arr;
+}
+
+// Union of several independent polygon groups in a single call.
+// coords holds the flat x0,y0,x1,y1,... data of all polygons, sizes the number of
+// points of each polygon and group_ids the group each polygon belongs to.
+// The inputs are read directly from the numpy buffers and the merged polygons of
+// all groups are returned as numpy arrays in the same (coords, sizes, group_ids)
+// layout.
+py::tuple unionBatched(const IntArray &coords,
+                       const IntArray &sizes,
+                       const IntArray &group_ids) {
+    if (coords.ndim() != 1 || sizes.ndim() != 1 || group_ids.ndim() != 1) {
+        throw std::invalid_argument("coords, sizes and group_ids must be 1D arrays");
+    }
+    if (sizes.size() != group_ids.size()) {
+        throw std::invalid_argument("sizes and group_ids must have the same length");
+    }
+    auto c = coords.unchecked<1>();
+    auto s = sizes.unchecked<1>();
+    auto g = group_ids.unchecked<1>();
+    std::map<int64_t, PolygonSet> groups;
+    py::ssize_t offset = 0;
+    for (py::ssize_t i = 0; i < s.shape(0); i++) {
+        py::ssize_t npts = static_cast<py::ssize_t>(s(i));
+        if (npts < 0 || offset + 2 * npts > c.shape(0)) {
+            throw std::invalid_argument("sizes do not match the length of coords");
+        }
+        std::vector<Point> pts;
+        pts.reserve(npts);
+        for (py::ssize_t j = 0; j < npts; j++) {
+            pts.push_back(gtl::construct<Point>(static_cast<int>(c(offset + 2 * j)),
+                                                static_cast<int>(c(offset + 2 * j + 1))));
+        }
+        Polygon poly;
+        gtl::set_points(poly, pts.begin(), pts.end());
+        groups[g(i)].push_back(poly);
+        offset += 2 * npts;
+    }
+
+    std::vector<int64_t> out_coords;
+    std::vector<int64_t> out_sizes;
+    std::vector<int64_t> out_ids;
+    for (auto &grp : groups) {
+        gtl::assign(grp.second, grp.second);
+        for (const Polygon &poly : grp.second) {
+            int64_t npts = 0;
+            for (auto v = poly.begin(); v != poly.end(); v++) {
+                out_coords.push_back(v->x());
+                out_coords.push_back(v->y());
+                npts++;
+            }
+            out_sizes.push_back(npts);
+            out_ids.push_back(grp.first);
+        }
+    }
+    return py::make_tuple(toIntArray(out_coords), toIntArray(out_sizes),
+                          toIntArray(out_ids));
+}
+
 PYBIND11_MODULE(boopy, m) {
     py::class_<PolyGroup>(m, "PolyGroup")
         .def(py::init<>())
@@ -91,4 +161,5 @@ PYBIND11_MODULE(boopy, m) {
         .def("exor", &PolyGroup::exor)
         .def("trapezoids", &PolyGroup::trapezoids)
         .def("resize", &PolyGroup::resize);
+    m.def("union_batched", &unionBatched);
 }
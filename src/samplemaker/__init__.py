@@ -34,10 +34,10 @@ LayoutPool = {}  # connects a SREF name to a particular geomgroup in the current
 
 # Additional cache pool:
 
-# _DevicePool Connects a device hash to a SREF to be instantiated:
+# _DevicePool Connects a device key (see Device._pool_key) to a SREF to be instantiated:
 _DevicePool = {}
 
-# _DeviceLocalParamPool connects a device hash to local parameters created by the call
+# _DeviceLocalParamPool connects a device key to local parameters created by the call
 # to geom():
 _DeviceLocalParamPool = {}
 
@@ -14,12 +14,20 @@ import numpy as np
 
 import samplemaker.makers as sm
 from samplemaker.baselib.waveguides import BaseWaveguidePort, BaseWaveguideSequencer
-from samplemaker.devices import Device, register_devices_in_module
-from samplemaker.shapes import GeomGroup
+from samplemaker.devices import Device, cached_geom, register_devices_in_module
+from samplemaker.shapes import GeomGroup, Poly
+
+# Rotates (N,2) row-vector points by 90 degrees counterclockwise: xy @ _ROT90
+_ROT90 = np.array([[0, 1], [-1, 0]])
 
 
 class CrossMark(Device):
-    """Generic cross marker for lithographic mask alignment."""
+    """Generic cross marker for lithographic mask alignment.
+
+    The two overlapping bars of the inner cross are only merged when the mask is
+    exported (see `samplemaker.shapes.GeomGroup.boolean_union_deferred`). The
+    geometry returned by `run()` still contains both bars.
+    """
 
     def initialize(self) -> None:
         """Initialize the cross mark device.
@@ -97,12 +105,16 @@ class CrossMark(Device):
         p = self.get_params()
         cross = sm.make_rect(0, 0, p["length1"], p["width1"], layer=1)
         cross += sm.make_rect(0, 0, p["width1"], p["length1"], layer=1)
-        cross.boolean_union(1)
+        cross.boolean_union_deferred(1)
         ocross = sm.make_rect(p["length1"] / 2, 0, p["length2"], p["width2"], numkey=4)
-        for i in range(4):
-            c = ocross.copy()
-            c.rotate(0, 0, 90 * i)
-            cross += c
+        # Quarter turns are exact coordinate swaps, no need to copy and rotate
+        arm0 = ocross.group[0]
+        xy = arm0.xy
+        for _ in range(4):
+            arm = Poly([], [], arm0.layer)
+            arm.set_data(xy.reshape(-1))
+            cross.add(arm)
+            xy = xy @ _ROT90
         if p["mark_number"] > 0:
             rot = 90 * (p["mark_number"] - 1)
             sq_dim = p["length1"] / 2 + p["length2"]
@@ -293,6 +305,7 @@ class FocusingGratingCoupler(Device):
             param_type=bool,
         )
 
+    @cached_geom()
     def geom(self) -> GeomGroup:
         """Define the grating coupler geometry.
 
@@ -316,24 +329,29 @@ class FocusingGratingCoupler(Device):
         nr_apo = p["nr_Apo"]
         ff_coef = p["ff_coef"]
 
+        # Arc parameters for all periods at once, only the arcs are built per period
+        q = np.arange(q0, qn, dtype=np.float64)
+        b = q * p0
+        x0 = b * b * math.sin(theta) / (q * lambda0)
+        a = b * b * n / (q * lambda0)
+        if nr_apo > 0:  # at least the first period is apodized
+            apo_slope = (1 - ff_coef) * ff / (nr_apo - 2)
+            ff_chi = np.where(
+                q <= q0 + nr_apo - 1, ff - apo_slope * (q0 + nr_apo - q), ff
+            )
+        else:
+            ff_chi = np.full_like(q, ff)
+        w = ff_chi * pitch
+
         g = GeomGroup()
-        for q in range(q0, qn):
-            b = q * p0
-            x0 = b * b * math.sin(theta) / (q * lambda0)
-            a = b * b * n / (q * lambda0)
-            if q <= q0 + nr_apo - 1:
-                ff_chi = ff - (1 - ff_coef) * ff / (nr_apo - 2) * (q0 + nr_apo - q)
-            else:
-                ff_chi = ff
-
-            w = ff_chi * pitch
+        for i in range(len(q)):
             g += sm.make_arc(
-                x0=x0,
+                x0=float(x0[i]),
                 y0=0,
-                rx=a,
-                ry=b,
+                rx=float(a[i]),
+                ry=float(b[i]),
                 rot=0,
-                w=w,
+                w=float(w[i]),
                 a1=-div_angle - 5,
                 a2=div_angle + 5,
                 layer=3,
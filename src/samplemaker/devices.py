@@ -181,6 +181,7 @@ More details on specifying circuits are given in the tutorials, where it is also
 explained how to nest circuits together (i.e. creating netlists of netslists)
 """
 
+import functools
 import inspect
 import math
 import sys
@@ -200,10 +201,11 @@ from samplemaker import (
     _DevicePool,
 )
 from samplemaker.gdswriter import GDSWriter
-from samplemaker.makers import make_sref, make_text
-from samplemaker.shapes import GeomGroup, Poly
+from samplemaker.makers import make_aref, make_sref, make_text
+from samplemaker.shapes import GeomGroup, Poly, resolve_deferred_unions
 
 ConnectorFunctionType: TypeAlias = Callable[["DevicePort", "DevicePort"], GeomGroup]
+GeomFunctionType: TypeAlias = Callable[["Device"], GeomGroup]
 
 
 class IncompatiblePortError(RuntimeError):
@@ -434,12 +436,15 @@ class DevicePort:
         None
 
         """
-        xc = self.x0 - self.dy() * radius
-        yc = self.y0 + self.dx() * radius
-        phi = self.angle() - math.pi / 2
-        self.x0 = radius * math.cos(phi + math.pi / 2) + xc
-        self.y0 = radius * math.sin(phi + math.pi / 2) + yc
-        self.set_angle(self.angle() + math.pi / 2)
+        # The port only points along the axes, so the end point of the quarter
+        # circle is found from the direction components without trigonometry
+        dx = self.dx()
+        dy = self.dy()
+        self.x0 += (dx - dy) * radius
+        self.y0 += (dx + dy) * radius
+        # E -> N -> W -> S -> E
+        self.bf = self.bf if self.hv else not self.bf
+        self.hv = not self.hv
 
     def BL(self, radius: float) -> None:  # noqa: N802
         """Make a 90 degree left bend with the given radius.
@@ -477,12 +482,13 @@ class DevicePort:
         None
 
         """
-        xc = self.x0 + self.dy() * radius
-        yc = self.y0 - self.dx() * radius
-        phi = self.angle() + math.pi / 2
-        self.x0 = radius * math.cos(phi - math.pi / 2) + xc
-        self.y0 = radius * math.sin(phi - math.pi / 2) + yc
-        self.set_angle(self.angle() - math.pi / 2)
+        dx = self.dx()
+        dy = self.dy()
+        self.x0 += (dx + dy) * radius
+        self.y0 += (dy - dx) * radius
+        # E -> S -> W -> N -> E
+        self.bf = not self.bf if self.hv else self.bf
+        self.hv = not self.hv
 
     def BR(self, radius: float) -> None:  # noqa: N802
         """Make a 90 degree right bend with the given radius.
@@ -597,6 +603,25 @@ class Device:
                 flatdict[parent_str + key] = value
         return flatdict
 
+    def _pool_key(self) -> tuple:
+        """Get the key identifying the geometry of the device in the device pool.
+
+        Based on the device name, parameters and if a sequencer is used, the sequencer
+        options. Unlike the hash value, the key is compared by content and stays valid
+        when the pool is stored in a cache file and loaded by another Python process.
+
+        Returns
+        -------
+        tuple
+            The device key.
+
+        """
+        if hasattr(self, "_seq"):
+            fldict = self.__flatdict(self._seq.options, "")
+            return (frozenset(self._p.items()), self._name, frozenset(fldict.items()))
+
+        return (frozenset(self._p.items()), self._name)
+
     def __hash__(self) -> int:
         """Hash function for the device.
 
@@ -609,13 +634,7 @@ class Device:
             The hash value of the device.
 
         """
-        if hasattr(self, "_seq"):
-            fldict = self.__flatdict(self._seq.options, "")
-            return hash(
-                (frozenset(self._p.items()), self._name, frozenset(fldict.items()))
-            )
-
-        return hash((frozenset(self._p.items()), self._name))
+        return hash(self._pool_key())
 
     def angle(self) -> float:
         """Return the orientation of the device in radians.
@@ -1007,7 +1026,7 @@ class Device:
         """
         if self.use_references:
             # Check if it is in the device pool
-            hsh = self.__hash__()
+            hsh = self._pool_key()
             srefname = self._p["NETLIST"].name if "NETLIST" in self._p else self._name
             if srefname not in _DeviceCountPool:
                 _DeviceCountPool[srefname] = 0
@@ -1044,6 +1063,54 @@ class Device:
             port.y0 += self._y0
         return g
 
+    def as_aref(
+        self, ncols: int, nrows: int, xspacing: float, yspacing: float
+    ) -> GeomGroup:
+        """Run the device and place it as a regular array of cell references.
+
+        The device geometry is stored once in the layout pool and referenced by a
+        single GDS AREF element, instead of repeating the geometry for each copy.
+        The array starts at the device position and extends along the positive x and
+        y directions. Ports are those of the first element of the array.
+
+        Parameters
+        ----------
+        ncols : int
+            Number of columns of the array.
+        nrows : int
+            Number of rows of the array.
+        xspacing : float
+            Distance between two columns in um.
+        yspacing : float
+            Distance between two rows in um.
+
+        Returns
+        -------
+        GeomGroup
+            A geometry containing a single array reference.
+
+        """
+        use_references = self.use_references
+        self.use_references = True
+        try:
+            sref = self.run().group[0]
+        finally:
+            self.use_references = use_references
+
+        return make_aref(
+            sref.x0,
+            sref.y0,
+            sref.cellname,
+            sref.group,
+            ncols,
+            nrows,
+            xspacing,
+            0,
+            0,
+            yspacing,
+            angle=sref.angle,
+        )
+
     def ports(self) -> None:
         """Add ports to the device.
 
@@ -1098,6 +1165,62 @@ class Device:
         return device
 
 
+def cached_geom(maxsize: int = 64) -> Callable[[GeomFunctionType], GeomFunctionType]:
+    """Decorate a `Device.geom()` method to memoize its geometry.
+
+    The geometry is cached by device class and device key (i.e. name and parameter
+    values), so that calling `run()` again with parameters seen before skips the
+    drawing code. This is useful for expensive devices that are re-rendered often,
+    for example in `samplemaker.viewers.inspect_device`.
+
+    The decorated `geom()` must be a pure function of the device parameters. Local
+    parameters and local ports created by `geom()` are stored along with the
+    geometry and restored on a cache hit. A copy of the cached geometry is returned,
+    so callers can modify it freely. When the cache is full, the oldest entry is
+    discarded.
+
+    Usage:
+
+        class MyDevice(Device):
+            @cached_geom()
+            def geom(self):
+                ...
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Maximum number of geometries kept in the cache, by default 64.
+
+    Returns
+    -------
+    Callable[[GeomFunctionType], GeomFunctionType]
+        The decorator.
+
+    """
+
+    def decorator(geom_fun: GeomFunctionType) -> GeomFunctionType:
+        cache: dict[tuple[type, tuple], tuple[GeomGroup, dict[str, Any]]] = {}
+
+        @functools.wraps(geom_fun)
+        def wrapper(self: Device) -> GeomGroup:
+            key = (type(self), self._pool_key())
+            if key in cache:
+                geom, localp = cache[key]
+                self._localp = deepcopy(localp)
+                return geom.copy()
+
+            geom = geom_fun(self)
+            if len(cache) >= maxsize:
+                cache.pop(next(iter(cache)))
+            cache[key] = (geom.copy(), deepcopy(self._localp))
+            return geom
+
+        wrapper.cache_clear = cache.clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
 class NetListEntry:
     """Class that defines a single entry in a netlist."""
 
@@ -1155,15 +1278,34 @@ class NetListEntry:
             The hash value of the netlist entry.
 
         """
-        return hash(
-            (
-                self.devname,
-                self.x0,
-                self.y0,
-                self.rot,
-                frozenset(self.portmap.items()),
-                frozenset(self.params.items()),
-            )
+        return hash(self._key())
+
+    def __eq__(self, other: object) -> bool:
+        """Compare netlist entries by the same attributes used for hashing.
+
+        Parameters
+        ----------
+        other : object
+            The object to compare to.
+
+        Returns
+        -------
+        bool
+            True if both entries describe the same device placement.
+
+        """
+        if not isinstance(other, NetListEntry):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def _key(self) -> tuple:
+        return (
+            self.devname,
+            self.x0,
+            self.y0,
+            self.rot,
+            frozenset(self.portmap.items()),
+            frozenset(self.params.items()),
         )
 
 
@@ -1202,13 +1344,32 @@ class NetList:
             The hash value of the netlist.
 
         """
-        return hash(
-            (
-                self.name,
-                tuple(self.entry_list),
-                tuple(self.external_ports),
-                tuple(self.aligned_ports),
-            )
+        return hash(self._key())
+
+    def __eq__(self, other: object) -> bool:
+        """Compare netlists by the same attributes used for hashing.
+
+        Parameters
+        ----------
+        other : object
+            The object to compare to.
+
+        Returns
+        -------
+        bool
+            True if both netlists describe the same circuit.
+
+        """
+        if not isinstance(other, NetList):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def _key(self) -> tuple:
+        return (
+            self.name,
+            tuple(self.entry_list),
+            tuple(self.external_ports),
+            tuple(self.aligned_ports),
         )
 
     def set_external_ports(self, ext_ports: Sequence[str]) -> None:
@@ -1445,9 +1606,22 @@ class Circuit(Device):
         int
             The hash value of the circuit.
 
+        """
+        return hash(self._pool_key())
+
+    def _pool_key(self) -> tuple:
+        """Get the key identifying the geometry of the circuit in the device pool.
+
+        Based on the NETLIST parameter and the device name.
+
+        Returns
+        -------
+        tuple
+            The circuit key.
+
         """
         flatdict = self.__flatdict(self._p, "")
-        return hash((frozenset(flatdict.items()), self._name))
+        return (frozenset(flatdict.items()), self._name)
 
     def initialize(self) -> None:
         """Name the Circuit as 'X' to be referred in other circuits.
@@ -1797,6 +1971,7 @@ def create_device_library(devname: str, params: dict, filename: str) -> None:
         g += make_text(val.x0, val.y0, idtxt, 0, 0)
 
     g = g.flatten()
+    resolve_deferred_unions([g])
 
     gdsw = GDSWriter()
     gdsw.open_library(filename)
@@ -109,8 +109,8 @@ from samplemaker import (
 from samplemaker.devices import Device, DevicePort, IncompatiblePortError
 from samplemaker.gdsreader import GDSReader
 from samplemaker.gdswriter import GDSWriter
-from samplemaker.makers import make_aref, make_circle, make_path, make_text
-from samplemaker.shapes import Box, GeomGroup, SRef
+from samplemaker.makers import make_circle, make_path, make_text
+from samplemaker.shapes import Box, GeomGroup, SRef, resolve_deferred_unions
 
 TAB_POS_TYPE: TypeAlias = list[list[tuple[float, float]]]
 TAB_POS_INPUT_TYPE: TypeAlias = Sequence[Sequence[Sequence[float]]]
@@ -213,34 +213,11 @@ class MarkerSet(Marker):
 
         """
         self.dev.use_references = True
-        g = self.dev.run()
-        sref = g.group[0]
-        if self.mset == 2:
-            return make_aref(
-                self.x0,
-                self.y0,
-                sref.cellname,
-                sref.group,
-                2,
-                1,
-                self.xdist,
-                0,
-                0,
-                self.ydist,
-            )
-        if self.mset == 4:
-            return make_aref(
-                self.x0,
-                self.y0,
-                sref.cellname,
-                sref.group,
-                2,
-                2,
-                self.xdist,
-                0,
-                0,
-                self.ydist,
-            )
+        if self.mset == 1:
+            g = self.dev.run()
+        else:
+            # 2 marks in a row or 4 marks in a 2x2 array
+            g = self.dev.as_aref(2, self.mset // 2, self.xdist, self.ydist)
         return g.translate(self.x0, self.y0)
 
 
@@ -1173,6 +1150,7 @@ class Mask:
 
         """
         self.__cleanup_cellref()
+        resolve_deferred_unions(LayoutPool.values())
         if self.cache:
             try:
                 gdsr = GDSReader()
@@ -16,6 +16,7 @@ directly.
 import math
 from collections.abc import Sequence
 
+import numpy as np
 from numpy.typing import ArrayLike
 
 import samplemaker.shapes as smsh
@@ -541,17 +542,20 @@ def make_rect(
         A geometry containing a single rectangle.
 
     """
-    r1 = make_poly(
-        [x0 - width / 2, x0 + width / 2, x0 + width / 2, x0 - width / 2],
-        [y0 - height / 2, y0 - height / 2, y0 + height / 2, y0 + height / 2],
-        layer,
-    )
     if numkey != 5:
         xoff = -((numkey - 1) % 3 - 1)
         yoff = math.floor((9 - numkey) / 3) - 1
-        r1.translate(xoff * width / 2, yoff * height / 2)
-
-    return r1
+        x0 += xoff * width / 2
+        y0 += yoff * height / 2
+
+    # The corners are known, so the closed data array is filled in directly
+    x1, x2 = x0 - width / 2, x0 + width / 2
+    y1, y2 = y0 - height / 2, y0 + height / 2
+    poly = smsh.Poly([], [], layer)
+    poly.set_data(np.array([x1, y1, x2, y1, x2, y2, x1, y2, x1, y1], dtype=np.float64))
+    g = GeomGroup()
+    g.add(poly)
+    return g
 
 
 def make_rounded_rect(
@@ -1,3 +1,6 @@
+import numpy as np
+import numpy.typing as npt
+
 class PolyGroup:
     def __init__(self) -> None: ...
     def addPolyData(self, data: list[int]) -> None: ...
@@ -18,3 +21,9 @@ class PolyGroup:
         corner_fill_arc: bool,
         num_circle_segments: int,
     ) -> None: ...
+
+def union_batched(
+    coords: npt.ArrayLike,
+    sizes: npt.ArrayLike,
+    group_ids: npt.ArrayLike,
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.int64]]: ...
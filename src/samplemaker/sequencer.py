@@ -267,12 +267,41 @@ class Sequencer:
             The dictionary with instructions.
 
         """
+        self._program: list[tuple[COMMAND_CALLABLE_TYPE, ARGS_TYPE]] | None = None
         self.seq = seq
         self.options = seq_options
         self.dic = seq_dictionary
         self.state = seq_state.state
         self.debug_state = False
 
+    @property
+    def seq(self) -> SEQ_TYPE:
+        """The sequence of instructions executed by `run`.
+
+        Assigning a new sequence discards the compiled program, modifying the list in
+        place does not.
+        """
+        return self._seq
+
+    @seq.setter
+    def seq(self, value: SEQ_TYPE) -> None:
+        self._seq = value
+        self._program = None
+
+    @property
+    def dic(self) -> COMMANDS_DICT_TYPE:
+        """The dictionary used to interpret the commands of the sequence.
+
+        Assigning a new dictionary discards the compiled program, modifying it in
+        place does not.
+        """
+        return self._dic
+
+    @dic.setter
+    def dic(self, value: COMMANDS_DICT_TYPE) -> None:
+        self._dic = value
+        self._program = None
+
     def set_debug_state(self, value: bool) -> None:
         """Set debug mode.
 
@@ -313,15 +342,62 @@ class Sequencer:
         self.state["y"] = 0
         self.state["a"] = 0
 
+    def _compile(self) -> list[tuple[COMMAND_CALLABLE_TYPE, ARGS_TYPE]]:
+        """Resolve all instructions of the sequence to their command functions.
+
+        Returns
+        -------
+        list[tuple[COMMAND_CALLABLE_TYPE, ARGS_TYPE]]
+            The command function and arguments of each non-empty instruction.
+
+        Raises
+        ------
+        ValueError
+            If an instruction uses an unknown command or a wrong number of arguments.
+
+        """
+        program = []
+        for instr in self.seq:
+            if not len(instr):
+                continue
+
+            cmd = instr[0]
+            args = instr[1:]
+            if cmd not in self.dic:
+                msg = (
+                    f"Command {cmd} does not exist. "
+                    f"Available commands are {list(self.dic.keys())}"
+                )
+                raise ValueError(msg)
+
+            nargs, func = self.dic[cmd]
+            if nargs != len(args):
+                msg = (
+                    f"Wrong number of arguments for command {cmd}."
+                    f" Expected {nargs}, got {len(args)}"
+                )
+                raise ValueError(msg)
+
+            program.append((func, args))
+        return program
+
     def run(self) -> GeomGroup:
         """Execute the sequence and get the final geometry object.
 
+        The sequence is compiled to a list of command functions on the first call and
+        the compiled program is re-used by later calls, until `seq` or `dic` are
+        reassigned. The whole sequence is validated before any instruction is
+        executed.
+
         Returns
         -------
         GeomGroup
             The resulting geometry.
 
         """
+        if self._program is None:
+            self._program = self._compile()
+        program = self._program
         g = GeomGroup()
         init_fun = self.dic["INIT"][1]
         try:
@@ -353,28 +429,8 @@ class Sequencer:
                 )
                 raise TypeError(msg) from e
 
-        for instr in self.seq:
-            if not len(instr):
-                continue
-
-            cmd = instr[0]
-            args = instr[1:]
-            if cmd not in self.dic:
-                msg = (
-                    f"Command {cmd} does not exist. "
-                    f"Available commands are {list(self.dic.keys())}"
-                )
-                raise ValueError(msg)
-
-            action = self.dic[cmd]
-            if action[0] != len(args):
-                msg = (
-                    f"Wrong number of arguments for command {cmd}."
-                    f" Expected {action[0]}, got {len(args)}"
-                )
-                raise ValueError(msg)
-
-            g += action[1](args, self.state, self.options)
+        for func, args in program:
+            g += func(args, self.state, self.options)
             if self.debug_state:
                 print(f"self state {self.state}")
 
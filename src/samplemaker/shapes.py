@@ -70,7 +70,7 @@ to save memory and computation time. For example
 import math
 import pathlib
 import warnings
-from collections.abc import Collection, Sequence
+from collections.abc import Callable, Collection, Iterable, Sequence
 from copy import deepcopy
 from pathlib import Path as _Path
 from typing import Any, Self
@@ -84,6 +84,13 @@ from samplemaker.resources import boopy  # type: ignore[import]
 
 _glyphs = {}
 
+# Polygon approximations of rings and arcs returned by Ring.to_polygon_cached().
+# Keyed on the shape values rather than stored in the objects, so that the identical
+# shapes created by each rebuild of a device are found again. Oldest entries are
+# dropped first once the cache is full.
+_RingPolygonCache: dict[tuple, "GeomGroup"] = {}
+_RING_POLYGON_CACHE_SIZE = 4096
+
 _STENCIL_FONT_FILENAME = "sm_stencil_font.txt"
 _STENCIL_FONT_ENCODING = "ISO-8859-1"
 _STENCIL_FONT_PATH = (
@@ -91,6 +98,69 @@ _STENCIL_FONT_PATH = (
 )
 
 
+def _rotation_matrix(rot: float) -> np.ndarray:
+    """Get the matrix rotating (N,2) row-vector points counterclockwise.
+
+    Parameters
+    ----------
+    rot : float
+        Rotation angle in degrees.
+
+    Returns
+    -------
+    np.ndarray
+        The 2x2 matrix `R` such that `xy @ R` is the rotated set of points.
+
+    """
+    cost = math.cos(rot / 180 * math.pi)
+    sint = math.sin(rot / 180 * math.pi)
+    return np.array([[cost, sint], [-sint, cost]])
+
+
+def _sample_arc(
+    x0: float,
+    y0: float,
+    rx: float,
+    ry: float,
+    rot: float,
+    w: float,
+    a1: float,
+    a2: float,
+    npts: int,
+) -> np.ndarray:
+    """Sample the outer and inner contour of an elliptical arc of finite width.
+
+    Parameters
+    ----------
+    x0, y0 : float
+        Center of the arc.
+    rx, ry : float
+        Radii of the arc center line along x and y before rotation.
+    rot : float
+        Rotation angle in degrees around the center.
+    w : float
+        Width of the arc.
+    a1, a2 : float
+        Start and end angle in degrees.
+    npts : int
+        Number of segments along each contour.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (2, npts + 1, 2) with the outer (radius + w/2) and inner
+        (radius - w/2) contour points, both running from `a1` to `a2`.
+
+    """
+    th = np.linspace(math.radians(a1), math.radians(a2), npts + 1)
+    unit = np.column_stack((np.cos(th), np.sin(th)))
+    radii = np.array([[[rx + w / 2, ry + w / 2]], [[rx - w / 2, ry - w / 2]]])
+    xy = unit * radii
+    if rot != 0:
+        xy = xy @ _rotation_matrix(rot)
+    return xy + np.array([x0, y0])
+
+
 class GeomGroup:
     """A group of geometry elements.
 
@@ -213,6 +283,51 @@ class GeomGroup:
 
         return layer_list
 
+    def _transform_polys(
+        self, transform: Callable[[np.ndarray], np.ndarray], min_polys: int = 2
+    ) -> list:
+        """Apply a vertex transform to all polygons of the group at once.
+
+        The vertices of all polygons are gathered in a single (M,2) array, transformed
+        with one array operation and split back into the polygons, which then hold
+        views of the transformed array. Gathering and splitting has a fixed cost, so
+        groups with fewer than `min_polys` polygons are left to the per-element
+        transforms.
+
+        Parameters
+        ----------
+        transform : Callable[[np.ndarray], np.ndarray]
+            Function mapping an (M,2) array of points to the transformed points.
+        min_polys : int, optional
+            Minimum number of polygons for the batched transform. Default is 2.
+
+        Returns
+        -------
+        list
+            The elements of the group that were not transformed and should be
+            transformed individually.
+
+        """
+        polys = []
+        others = []
+        for geom in self.group:
+            if isinstance(geom, Poly):
+                polys.append(geom)
+            else:
+                others.append(geom)
+        # The same polygon object listed twice has to be transformed twice
+        if len(polys) < min_polys or len({id(poly) for poly in polys}) != len(polys):
+            return self.group
+
+        sizes = [poly.data.size for poly in polys]
+        xy = np.concatenate([poly.data for poly in polys]).reshape(-1, 2)
+        data = transform(xy).reshape(-1)
+        for poly, pdata in zip(
+            polys, np.split(data, np.cumsum(sizes)[:-1]), strict=True
+        ):
+            poly.data = pdata
+        return others
+
     def translate(self, dx: float, dy: float) -> Self:
         """Shift the entire geometry by dx and dy.
 
@@ -229,7 +344,10 @@ class GeomGroup:
             Reference to the object.
 
         """
-        for geom in self.group:
+        offset = np.array([dx, dy])
+        # Poly.translate is two in-place additions, batching only pays off for
+        # larger groups
+        for geom in self._transform_polys(lambda xy: xy + offset, min_polys=16):
             geom.translate(dx, dy)
         return self
 
@@ -253,7 +371,9 @@ class GeomGroup:
             Reference to the object.
 
         """
-        for geom in self.group:
+        rmat = _rotation_matrix(rot)
+        offset = np.array([dx, dy])
+        for geom in self._transform_polys(lambda xy: xy @ rmat + offset):
             geom.rotate_translate(dx, dy, rot)
         return self
 
@@ -275,7 +395,9 @@ class GeomGroup:
             Reference to the object.
 
         """
-        for geom in self.group:
+        rmat = _rotation_matrix(rot)
+        center = np.array([x0, y0])
+        for geom in self._transform_polys(lambda xy: (xy - center) @ rmat + center):
             geom.rotate(x0, y0, rot)
         return self
 
@@ -299,7 +421,9 @@ class GeomGroup:
             Reference to the object.
 
         """
-        for geom in self.group:
+        center = np.array([x0, y0])
+        factors = np.array([scale_x, scale_y])
+        for geom in self._transform_polys(lambda xy: (xy - center) * factors + center):
             geom.scale(x0, y0, scale_x, scale_y)
         return self
 
@@ -317,7 +441,7 @@ class GeomGroup:
             Reference to the object.
 
         """
-        for geom in self.group:
+        for geom in self._transform_polys(lambda xy: xy * [-1, 1] + [2 * x0, 0]):
             geom.mirror_x(x0)
         return self
 
@@ -359,7 +483,7 @@ class GeomGroup:
             Reference to the object.
 
         """
-        for geom in self.group:
+        for geom in self._transform_polys(lambda xy: xy * [1, -1] + [0, 2 * y0]):
             geom.mirror_y(y0)
         return self
 
@@ -983,6 +1107,40 @@ class GeomGroup:
         self.__set_boopy__(pg0, layer)
         return self
 
+    def boolean_union_deferred(self, layer: int) -> Self:
+        """Mark all polygons matching a layer for a boolean union at export time.
+
+        The polygons are left untouched and are merged by `resolve_deferred_unions`,
+        which `samplemaker.layout.Mask.export_gds` calls once for all cells. Unions
+        requested by many devices are then computed in a single call to the Boolean
+        library instead of one call per device.
+
+        Until then the group still contains the overlapping polygons, so geometry
+        returned by `Device.run()` is unmerged and for example `get_area()` counts
+        the overlaps twice. Call `resolve_deferred_unions` first if the merged
+        geometry is needed before export.
+
+        All marked polygons (including copies of them) that end up in the same cell
+        and layer are merged together, also if they were marked by different calls.
+        Overlapping polygons from separate devices in a cell are thus written as a
+        single polygon.
+
+        Parameters
+        ----------
+        layer : int
+            The layer in which the union should be performed.
+
+        Returns
+        -------
+        Self
+            Reference to the object.
+
+        """
+        for geom in self.group:
+            if isinstance(geom, Poly) and geom.layer == layer:
+                geom._union_deferred = True
+        return self
+
     def boolean_difference(
         self,
         target_b: "GeomGroup | _legacy.MissingType" = _legacy.MISSING,
@@ -1417,6 +1575,61 @@ class GeomGroup:
         return ndisc
 
 
+def resolve_deferred_unions(groups: Iterable[GeomGroup]) -> None:
+    """Perform all boolean unions requested by `GeomGroup.boolean_union_deferred`.
+
+    All marked polygons of a group are merged per layer, polygons that were not marked
+    are left untouched. The unions of all groups and layers are computed with a single
+    call to the Boolean library. The operation is performed in-place.
+
+    Parameters
+    ----------
+    groups : Iterable[GeomGroup]
+        The groups to be processed, typically all cells of a layout.
+
+    Returns
+    -------
+    None
+
+    """
+    groups = list(groups)
+    keys = {}  # (group index, layer) -> union id
+    coords = []
+    sizes = []
+    union_ids = []
+    for gi, grp in enumerate(groups):
+        for geom in grp.group:
+            if not (isinstance(geom, Poly) and getattr(geom, "_union_deferred", False)):
+                continue
+            pdata = geom.int_data()
+            coords.append(pdata)
+            sizes.append(pdata.size // 2)
+            union_ids.append(keys.setdefault((gi, geom.layer), len(keys)))
+
+    if not keys:
+        return
+
+    for gi in {key[0] for key in keys}:
+        groups[gi].group[:] = [
+            g
+            for g in groups[gi].group
+            if not (isinstance(g, Poly) and getattr(g, "_union_deferred", False))
+        ]
+
+    out_coords, out_sizes, out_ids = boopy.union_batched(
+        np.concatenate(coords), np.array(sizes), np.array(union_ids)
+    )
+    targets = {uid: key for key, uid in keys.items()}
+    data = out_coords / 1000.0
+    start = 0
+    for size, uid in zip(out_sizes.tolist(), out_ids.tolist(), strict=True):
+        gi, layer = targets[uid]
+        poly = Poly([], [], layer)
+        poly.set_data(data[start : start + 2 * size])
+        groups[gi].add(poly)
+        start += 2 * size
+
+
 class Dot:
     """Point helper class used for geometric transformations."""
 
@@ -1840,6 +2053,8 @@ class Poly:
         """
         self.layer = layer
         self.set_points(xpts, ypts)
+        # Set by GeomGroup.boolean_union_deferred
+        self._union_deferred = False
 
     def set_points(self, xpts: ArrayLike, ypts: ArrayLike) -> None:
         """Set polygon points from x and y coordinate arrays.
@@ -1882,6 +2097,21 @@ class Poly:
         self.data = data
         self.Npts = math.floor(self.data.size / 2)
 
+    @property
+    def xy(self) -> np.ndarray:
+        """Get the polygon points as an (N,2) array.
+
+        The array is a view of `data` (including the closing point), modifying it
+        modifies the polygon.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (Npts, 2) with one x, y point per row.
+
+        """
+        return self.data.reshape(-1, 2)
+
     def int_data(self) -> np.ndarray:
         """Get polygon data scaled to integer nanometer units.
 
@@ -2084,10 +2314,9 @@ class Poly:
             Axis-aligned bounding box.
 
         """
-        llx = min(self.data[0::2])
-        urx = max(self.data[0::2])
-        lly = min(self.data[1::2])
-        ury = max(self.data[1::2])
+        xy = self.xy
+        llx, lly = xy.min(axis=0)
+        urx, ury = xy.max(axis=0)
         return Box(llx, lly, urx - llx, ury - lly)
 
     def area(self) -> float:
@@ -4163,27 +4392,56 @@ class Ring(Ellipse):
         npts = _legacy.get_optional_kwarg("npts", npts, 32, "Npts", kwargs)
         _legacy.ensure_empty_kwargs("Ring.to_polygon", kwargs)
 
-        xpts = np.array([0.0] * (2 + npts * 2))
-        ypts = np.array([0.0] * (2 + npts * 2))
-        for i in range(1 + npts):
-            xpts[i] = math.cos(i * 2 * math.pi / npts) * (self.r + self.w / 2) + self.x0
-            ypts[i] = (
-                math.sin(i * 2 * math.pi / npts) * (self.r1 + self.w / 2) + self.y0
-            )
-        for i in range(1 + npts):
-            j = npts - i
-            xpts[i + 1 + npts] = (
-                math.cos(j * 2 * math.pi / npts) * (self.r - self.w / 2) + self.x0
-            )
-            ypts[i + 1 + npts] = (
-                math.sin(j * 2 * math.pi / npts) * (self.r1 - self.w / 2) + self.y0
-            )
-        p1 = Poly(xpts, ypts, self.layer)
-        p1.rotate(self.x0, self.y0, self.rot)
+        outer, inner = _sample_arc(
+            self.x0, self.y0, self.r, self.r1, self.rot, self.w, 0, 360, npts
+        )
+        xy = np.concatenate((outer, inner[::-1]))
+        p1 = Poly(xy[:, 0], xy[:, 1], self.layer)
         g = GeomGroup()
         g.add(p1)
         return g
 
+    def to_polygon_cached(self, npts: int = 32) -> GeomGroup:
+        """Approximate the shape with a polygon, re-using previous results.
+
+        Polygons are kept in a bounded module-level cache, keyed on the shape type,
+        position, radii, width, rotation, angles, layer and `npts`. Any shape with
+        the same values, including one created by a later rebuild of a device, gets
+        the same group. The returned group is shared with the cache and should not
+        be modified, use `to_polygon` to get a modifiable copy.
+
+        Parameters
+        ----------
+        npts : int, optional
+            Number of segments used per contour. Default is 32.
+
+        Returns
+        -------
+        GeomGroup
+            Group containing the polygon approximation.
+
+        """
+        key = (
+            type(self),
+            self.x0,
+            self.y0,
+            self.r,
+            self.r1,
+            self.w,
+            self.rot,
+            getattr(self, "a1", None),
+            getattr(self, "a2", None),
+            self.layer,
+            npts,
+        )
+        g = _RingPolygonCache.get(key)
+        if g is None:
+            g = self.to_polygon(npts)
+            if len(_RingPolygonCache) >= _RING_POLYGON_CACHE_SIZE:
+                del _RingPolygonCache[next(iter(_RingPolygonCache))]
+            _RingPolygonCache[key] = g
+        return g
+
 
 class Arc(Ring):
     """Arc segment of an elliptical ring."""
@@ -4314,36 +4572,25 @@ class Arc(Ring):
         npts = _legacy.get_optional_kwarg("npts", npts, 32, "Npts", kwargs)
         _legacy.ensure_empty_kwargs("Arc.to_polygon", kwargs)
 
-        npts += 1
-        th = np.linspace(math.radians(self.a1), math.radians(self.a2), npts)
-        xpts1 = np.cos(th) * (self.r + self.w / 2) + self.x0
-        ypts1 = np.sin(th) * (self.r1 + self.w / 2) + self.y0
-        xpts2 = np.cos(th) * (self.r - self.w / 2) + self.x0
-        ypts2 = np.sin(th) * (self.r1 - self.w / 2) + self.y0
+        outer, inner = _sample_arc(
+            self.x0,
+            self.y0,
+            self.r,
+            self.r1,
+            self.rot,
+            self.w,
+            self.a1,
+            self.a2,
+            npts,
+        )
         g = GeomGroup()
         if autosplit:
-            for i in range(npts - 1):
-                p1 = Poly(
-                    xpts=np.append(
-                        xpts1[i : (i + 2)],
-                        xpts2[(-npts + 1 + i) : (-npts - 1 + i) : -1],
-                    ),
-                    ypts=np.append(
-                        ypts1[i : (i + 2)],
-                        ypts2[(-npts + 1 + i) : (-npts - 1 + i) : -1],
-                    ),
-                    layer=self.layer,
-                )
-                p1.rotate(self.x0, self.y0, self.rot)
-                g.add(p1)
+            for i in range(npts):
+                xy = np.concatenate((outer[i : i + 2], inner[[i + 1, i]]))
+                g.add(Poly(xy[:, 0], xy[:, 1], self.layer))
         else:
-            p1 = Poly(
-                xpts=np.append(xpts1, xpts2[::-1]),
-                ypts=np.append(ypts1, ypts2[::-1]),
-                layer=self.layer,
-            )
-            p1.rotate(self.x0, self.y0, self.rot)
-            g.add(p1)
+            xy = np.concatenate((outer, inner[::-1]))
+            g.add(Poly(xy[:, 0], xy[:, 1], self.layer))
         return g
 
 
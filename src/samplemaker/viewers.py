@@ -5,75 +5,175 @@ and circuits. They can be used instead of writing and opening GDS files external
 viewers.
 """
 
+import functools
 import warnings
+from typing import TYPE_CHECKING, Any
 
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.collections import PatchCollection
-from matplotlib.patches import Arrow, Circle, Ellipse, PathPatch, Polygon
-from matplotlib.textpath import TextPath
-from matplotlib.widgets import Slider
 
 import samplemaker.shapes as smsh
 from samplemaker.devices import Device, DevicePort
 from samplemaker.shapes import GeomGroup
 
-_ViewerCurrentSliders: list[Slider] = []
+# matplotlib is slow to import, it is only loaded once something is displayed so that
+# scripts importing this module just to export masks do not pay for it.
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import Collection, PatchCollection
+    from matplotlib.patches import Arrow, PathPatch
+    from matplotlib.widgets import Slider
+
+_ViewerCurrentSliders: "list[Slider]" = []
 _ViewerCurrentDevice: Device | None = None
-_ViewerCurrentAxes: plt.Axes | None = None
+_ViewerCurrentAxes: "plt.Axes | None" = None
+# Collections drawn in the inspected axes, updated in place when possible
+_ViewerCurrentCollections: "dict[str, Collection]" = {}
+_ViewerCurrentPorts: "PatchCollection | None" = None
+# Slider values used for the last render, to skip callbacks that change nothing
+_ViewerLastParams: dict[str, Any] = {}
+
 
+def __get_geom_buckets(grp: GeomGroup) -> dict[str, tuple[list, list]]:
+    import matplotlib as mpl
 
-def __get_geom_patches(grp: GeomGroup) -> list:
-    prop_cycle = plt.rcParams["axes.prop_cycle"]
+    prop_cycle = mpl.rcParams["axes.prop_cycle"]
     colors = prop_cycle.by_key()["color"]
-    patches = []
+    # Items and colors are gathered per kind of shape, so that each kind is drawn
+    # by a single collection instead of one patch per element.
+    buckets: dict[str, tuple[list, list]] = {
+        "poly": ([], []),
+        "path": ([], []),
+        "ref": ([], []),
+        "ellipse": ([], []),
+    }
     for geom in grp.group:
         if geom.layer < 0:
             continue
-        lcolor = colors[np.mod(geom.layer, 10)]
+        lcolor = colors[geom.layer % 10]
         if isinstance(geom, smsh.Poly):
-            n = int(len(geom.data) / 2)
-            xy = np.reshape(geom.data, (n, 2))
-            tmpp = Polygon(xy, closed=True)
-            tmpp.set_facecolor(lcolor)
-            patches.append(tmpp)
+            # Keep float64: xy is a view and matplotlib paths store float64,
+            # so converting to a smaller type would only add two copies.
+            buckets["poly"][0].append(geom.xy)
+            buckets["poly"][1].append(lcolor)
         elif isinstance(geom, smsh.Path):
-            xy = np.transpose([geom.xpts, geom.ypts])
-            tmpp = Polygon(xy, closed=False)
-            tmpp.set_edgecolor(lcolor)
-            tmpp.set_fill(False)
-            patches.append(tmpp)
+            buckets["path"][0].append(np.column_stack((geom.xpts, geom.ypts)))
+            buckets["path"][1].append(lcolor)
         elif isinstance(geom, smsh.Text):
-            # stacklevel=3 to point to calling function, not this one.
+            # stacklevel=4 to point to calling function, not the viewer internals.
             msg = "text display is not supported, please convert to polygon first."
-            warnings.warn(msg, stacklevel=3, category=UserWarning)
+            warnings.warn(msg, stacklevel=4, category=UserWarning)
         elif isinstance(geom, smsh.Ring):
-            gpl = geom.to_polygon()
-            g = gpl.group[0]
-            n = int(len(g.data) / 2)
-            xy = np.reshape(g.data, (n, 2))
-            tmpp = Polygon(xy, closed=True)
-            tmpp.set_facecolor(lcolor)
-            patches.append(tmpp)
+            buckets["poly"][0].append(geom.to_polygon_cached().group[0].xy)
+            buckets["poly"][1].append(lcolor)
         elif isinstance(geom, smsh.Ellipse):
-            tmpe = Ellipse((geom.x0, geom.y0), geom.r * 2, geom.r1 * 2, angle=geom.rot)
-            tmpe.set_facecolor(lcolor)
-            patches.append(tmpe)
+            buckets["ellipse"][0].append(
+                (geom.x0, geom.y0, geom.r * 2, geom.r1 * 2, geom.rot)
+            )
+            buckets["ellipse"][1].append(lcolor)
         elif isinstance(geom, smsh.Circle):
-            tmpc = Circle((geom.x0, geom.y0), geom.r)
-            tmpc.set_facecolor(lcolor)
-            patches.append(tmpc)
+            buckets["ellipse"][0].append((geom.x0, geom.y0, geom.r * 2, geom.r * 2, 0))
+            buckets["ellipse"][1].append(lcolor)
         elif isinstance(geom, smsh.SRef):
-            msg = "SRef and ARef display is not supported, please flatten first."
-            warnings.warn(msg, stacklevel=3, category=UserWarning)
-    return patches
+            # References are not flattened, only the outline of each cell is shown
+            bb = smsh.SRef.bounding_box(geom)
+            box = np.array(
+                [[bb.llx, bb.lly], [bb.urx, bb.lly], [bb.urx, bb.ury], [bb.llx, bb.ury]]
+            )
+            if isinstance(geom, smsh.ARef):
+                cols, rows = np.meshgrid(range(geom.ncols), range(geom.nrows))
+                dx = cols.ravel() * geom.ax + rows.ravel() * geom.bx
+                dy = cols.ravel() * geom.ay + rows.ravel() * geom.by
+                buckets["ref"][0].extend(box + d for d in np.column_stack((dx, dy)))
+            else:
+                buckets["ref"][0].append(box)
+    return {kind: bucket for kind, bucket in buckets.items() if bucket[0]}
+
+
+def __new_geom_collection(
+    ax: "plt.Axes", kind: str, items: list, colors: list
+) -> "Collection":
+    from matplotlib.collections import (
+        EllipseCollection,
+        PolyCollection,
+    )
+
+    if kind == "poly":
+        return PolyCollection(items, closed=True, facecolors=colors, edgecolors="none")
+    if kind == "path":
+        return PolyCollection(items, closed=False, facecolors="none", edgecolors=colors)
+    if kind == "ref":
+        return PolyCollection(
+            items,
+            closed=True,
+            facecolors="none",
+            edgecolors="gray",
+            linestyles="dashed",
+        )
+    ell = np.array(items)
+    xy = ell[:, :2]
+    # The collection only spans its centers, so extend limits to the full radius
+    rmax = np.max(ell[:, 2:4], axis=1, keepdims=True) / 2
+    ax.update_datalim(np.concatenate((xy - rmax, xy + rmax)))
+    return EllipseCollection(
+        ell[:, 2],
+        ell[:, 3],
+        ell[:, 4],
+        units="xy",
+        offsets=xy,
+        offset_transform=ax.transData,
+        facecolors=colors,
+        edgecolors="none",
+    )
+
+
+def __add_geom_collections(ax: "plt.Axes", grp: GeomGroup) -> "dict[str, Collection]":
+    collections = {}
+    for kind, (items, colors) in __get_geom_buckets(grp).items():
+        collections[kind] = __new_geom_collection(ax, kind, items, colors)
+        ax.add_collection(collections[kind])
+    return collections
+
+
+def __update_geom_collections(
+    ax: "plt.Axes", collections: "dict[str, Collection]", grp: GeomGroup
+) -> bool:
+    """Replace the vertices of existing collections with those of `grp`.
+
+    Returns False, leaving the collections untouched, if the kinds of shapes differ
+    or ellipses are present, in which case the collections have to be rebuilt.
+    """
+    buckets = __get_geom_buckets(grp)
+    if buckets.keys() != collections.keys() or "ellipse" in buckets:
+        return False
+    ax.ignore_existing_data_limits = True
+    for kind, (items, colors) in buckets.items():
+        coll = collections[kind]
+        coll.set_verts(items, closed=(kind != "path"))
+        if kind == "poly":
+            coll.set_facecolor(colors)
+        elif kind == "path":
+            coll.set_edgecolor(colors)
+        ax.update_datalim(np.concatenate(items))
+    return True
+
+
+# Building the text outline is slow and ports rarely move between slider changes.
+# The patches are only read when creating a PatchCollection, so they can be shared.
+@functools.lru_cache(maxsize=256)
+def _port_patches(
+    x0: float, y0: float, name: str, dx: float, dy: float
+) -> "tuple[Arrow, PathPatch]":
+    from matplotlib.patches import Arrow, PathPatch
+    from matplotlib.textpath import TextPath
+
+    tpath = TextPath((x0, y0), name, size=1)
+    return Arrow(x0, y0, dx, dy), PathPatch(tpath)
 
 
 def _get_port_patches(port: DevicePort) -> list:
     if port.name == "":
         return []
-    tpath = TextPath((port.x0, port.y0), port.name, size=1)
-    return [Arrow(port.x0, port.y0, port.dx(), port.dy()), PathPatch(tpath)]
+    return list(_port_patches(port.x0, port.y0, port.name, port.dx(), port.dy()))
 
 
 def __get_device_ports_patches(dev: Device) -> list:
@@ -84,13 +184,27 @@ def __get_device_ports_patches(dev: Device) -> list:
     return patches
 
 
+def __draw_device_ports(ax: "plt.Axes", dev: Device) -> None:
+    from matplotlib.collections import PatchCollection
+
+    global _ViewerCurrentPorts  # noqa: PLW0603
+
+    if _ViewerCurrentPorts is not None:
+        _ViewerCurrentPorts.remove()
+    _ViewerCurrentPorts = PatchCollection(
+        __get_device_ports_patches(dev), match_original=True
+    )
+    ax.add_collection(_ViewerCurrentPorts)
+
+
 def view_geometry(grp: GeomGroup) -> None:
     """Plot a geometry in a matplotlib window.
 
     Only polygons and circles are displayed. Most elements are either ignored or
     converted to polygon.
 
-    No flattening is performed, thus structure references are not displayed.
+    No flattening is performed, structure references are displayed as the outline
+    of the referenced cells.
 
     Parameters
     ----------
@@ -102,11 +216,11 @@ def view_geometry(grp: GeomGroup) -> None:
     None
 
     """
+    import matplotlib.pyplot as plt
+
     plt.close("all")
     _, ax = plt.subplots()
-    patches = __get_geom_patches(grp)
-    p = PatchCollection(patches, match_original=True)
-    ax.add_collection(p)
+    __add_geom_collections(ax, grp)
     plt.grid()
     plt.axis("equal")
     plt.show()
@@ -118,7 +232,8 @@ def GeomView(grp: GeomGroup) -> None:  # noqa: N802
     Only polygons and circles are displayed. Most elements are either ignored or
     converted to polygon.
 
-    No flattening is performed, thus structure references are not displayed.
+    No flattening is performed, structure references are displayed as the outline
+    of the referenced cells.
 
     Parameters
     ----------
@@ -145,22 +260,33 @@ def __update_scrollbar(_val: float) -> None:
     if dev is None or ax is None:
         return
 
-    for i, param in enumerate(dev._p):
-        dev.set_param(param, _ViewerCurrentSliders[i].val)
+    params = {}
+    for slider, param in zip(_ViewerCurrentSliders, dev._p, strict=True):
+        # Quantize integer parameters, so that moving the cursor between two snap
+        # points does not rebuild the device
+        if dev._ptype[param] in (int, bool):
+            params[param] = dev._ptype[param](round(slider.val))
+        else:
+            params[param] = slider.val
+    if params == _ViewerLastParams:
+        return
+    _ViewerLastParams.clear()
+    _ViewerLastParams.update(params)
+
+    for param, value in params.items():
+        dev.set_param(param, value)
 
     dev.initialize()
     g = dev.run()
 
-    patches = __get_geom_patches(g)
-    patches += __get_device_ports_patches(dev)
-    p = PatchCollection(patches, match_original=True)
-
-    ax.clear()
-    ax.add_collection(p)
-    ax.grid(True)
-    ax.set_title(dev._name)
+    if not __update_geom_collections(ax, _ViewerCurrentCollections, g):
+        for coll in _ViewerCurrentCollections.values():
+            coll.remove()
+        _ViewerCurrentCollections.clear()
+        ax.ignore_existing_data_limits = True
+        _ViewerCurrentCollections.update(__add_geom_collections(ax, g))
+    __draw_device_ports(ax, dev)
 
-    ax.margins(0.02)
     ax.autoscale_view()
 
     ax.figure.canvas.draw_idle()
@@ -202,12 +328,18 @@ def inspect_device(devcl: Device | type[Device]) -> None:
     None
 
     """
+    import matplotlib.pyplot as plt
+    from matplotlib.widgets import Slider
+
     global _ViewerCurrentDevice  # noqa: PLW0603
     global _ViewerCurrentSliders  # noqa: PLW0603
     global _ViewerCurrentAxes  # noqa: PLW0603
+    global _ViewerCurrentPorts  # noqa: PLW0603
 
     dev = _build_device(devcl)
     _ViewerCurrentDevice = dev
+    _ViewerLastParams.clear()
+    _ViewerLastParams.update(dev._p)
     g = dev.run()
 
     plt.close("all")
@@ -215,11 +347,10 @@ def inspect_device(devcl: Device | type[Device]) -> None:
     _, ax = plt.subplots()
     _ViewerCurrentAxes = ax
 
-    patches = __get_geom_patches(g)
-    patches += __get_device_ports_patches(dev)
-    p = PatchCollection(patches, match_original=True)
-
-    ax.add_collection(p)
+    _ViewerCurrentCollections.clear()
+    _ViewerCurrentCollections.update(__add_geom_collections(ax, g))
+    _ViewerCurrentPorts = None
+    __draw_device_ports(ax, dev)
     ax.grid(True)
     ax.set_title(dev._name)
 
@@ -243,10 +374,10 @@ def inspect_device(devcl: Device | type[Device]) -> None:
         valstep = dev._p[param] / 10
         if valstep == 0:
             valstep = 0.1
-        if isinstance(dev._ptype[param], int):
+        if dev._ptype[param] is int:
             maxv = int(maxv)
             valstep = 1
-        if isinstance(dev._ptype[param], bool):
+        if dev._ptype[param] is bool:
             maxv = 1
             valstep = 1
         if maxv == 0:
@@ -2,7 +2,7 @@
 
 import samplemaker.devices as smdev
 from samplemaker.baselib.waveguides import BaseWaveguidePort, BaseWaveguideSequencer
-from samplemaker.makers import make_rect
+from samplemaker.makers import make_path, make_rect
 from samplemaker.shapes import GeomGroup
 
 
@@ -45,6 +45,27 @@ class DummyDevice(smdev.Device):
         return rectangle
 
 
+class DummyPathDevice(smdev.Device):
+    """Test device made of a single open path."""
+
+    def initialize(self) -> None:
+        self.set_name("TESTLIB_DUMMY_PATH")
+        self.set_description("A dummy path device for testing purposes.")
+
+    def parameters(self) -> None:
+        self.addparameter(
+            param_name="length",
+            default_value=10.0,
+            param_description="Length of the path.",
+            param_type=float,
+            param_range=(1.0, 1000.0),
+        )
+
+    def geom(self) -> GeomGroup:
+        p = self.get_params()
+        return make_path([0, p["length"], p["length"]], [0, 0, 5], 0.5)
+
+
 def _dummy_connector(_port1: smdev.DevicePort, _port2: smdev.DevicePort) -> GeomGroup:
     return GeomGroup()
 
@@ -1,12 +1,17 @@
 """Tests for samplemaker.baselib.devices."""
 
+import numpy as np
 import pytest
 
+import samplemaker.devices as smdev
+import samplemaker.makers as sm
+import samplemaker.shapes as sp
 from samplemaker.baselib.devices import (
     CrossMark,
     DirectionalCoupler,
     FocusingGratingCoupler,
 )
+from tests.fakes import FakeGDSWriter
 
 
 def test_crossmark_layer_and_bbox_change_with_parameters() -> None:
@@ -126,3 +131,37 @@ def test_focusing_grating_coupler_bbox_changes_with_order_and_divergence() -> No
 
     assert bb_higher_order.width > bb_base.width
     assert bb_larger_divergence.height > bb_base.height
+
+
+def test_crossmark_device_library_merges_inner_cross(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    writers: list[FakeGDSWriter] = []
+
+    def _writer_factory() -> FakeGDSWriter:
+        writers.append(FakeGDSWriter())
+        return writers[-1]
+
+    monkeypatch.setattr(smdev, "GDSWriter", _writer_factory)
+    smdev.create_device_library("BASELIB_CMARK", {}, "unused.gds")
+
+    geom = writers[0].calls[1][2]
+    polys = [g for g in geom.group if isinstance(g, sp.Poly)]
+    assert len(polys) == 5
+    p = CrossMark.build()._p
+    inner = 2 * p["length1"] * p["width1"] - p["width1"] ** 2
+    assert geom.get_area() == pytest.approx(inner + 4 * p["length2"] * p["width2"])
+
+
+def test_crossmark_outer_arms_match_generic_rotation() -> None:
+    dev = CrossMark.build()
+    dev.use_references = False
+    geom = dev.run()
+
+    p = dev.get_params()
+    ocross = sm.make_rect(p["length1"] / 2, 0, p["length2"], p["width2"], numkey=4)
+    arms = geom.group[-4:]
+    for i, arm in enumerate(arms):
+        ref = ocross.copy()
+        ref.rotate(0, 0, 90 * i)
+        np.testing.assert_allclose(arm.data, ref.group[0].data, atol=1e-12)
@@ -1,10 +1,13 @@
 import math
+import pickle
 from pathlib import Path
 
 import pytest
 
+import samplemaker
 import samplemaker.devices as smdev
 import samplemaker.shapes as sp
+from samplemaker import LayoutPool
 from samplemaker.baselib.waveguides import BaseWaveguidePort, BaseWaveguideSequencer
 from samplemaker.shapes import GeomGroup
 from tests import dummy as dm
@@ -119,6 +122,27 @@ class TestDevicePort:
         assert port.y0 == pytest.approx(10.0)
         assert port.angle_to_text() == "N"
 
+    @pytest.mark.parametrize(
+        ("horizontal", "forward"),
+        [(True, True), (False, True), (True, False), (False, False)],
+    )
+    def test_bends_match_rotation_about_center(
+        self, horizontal: bool, forward: bool
+    ) -> None:
+        radius = 2.5
+        for bend, sign in (("bend_left", 1), ("bend_right", -1)):
+            port = smdev.DevicePort(1.0, -2.0, horizontal, forward)
+            expected = smdev.DevicePort(1.0, -2.0, horizontal, forward)
+            xc = port.x0 - sign * port.dy() * radius
+            yc = port.y0 + sign * port.dx() * radius
+            expected.rotate(xc, yc, sign * 90)
+
+            getattr(port, bend)(radius)
+
+            assert port.x0 == pytest.approx(expected.x0)
+            assert port.y0 == pytest.approx(expected.y0)
+            assert port.angle_to_text() == expected.angle_to_text()
+
     def test_fix_updates_reset_anchor(self) -> None:
         port = smdev.DevicePort(0.0, 0.0, True, True)
         port.move_straight(5.0)
@@ -161,6 +185,29 @@ class TestDevice:
         assert dev._description == "A dummy device for testing purposes."
         assert set(dev._p.keys()) == {"width", "height"}
 
+    def test_as_aref_references_pooled_geometry(
+        self, dummy_device: smdev.Device
+    ) -> None:
+        dummy_device.use_references = False
+        dummy_device.set_position(5.0, -2.0)
+        g = dummy_device.as_aref(3, 2, 20.0, 10.0)
+
+        assert dummy_device.use_references is False
+        assert len(g.group) == 1
+        aref = g.group[0]
+        assert isinstance(aref, sp.ARef)
+        assert aref.cellname in LayoutPool
+        assert (aref.x0, aref.y0) == pytest.approx((5.0, -2.0))
+        assert (aref.ncols, aref.nrows) == (3, 2)
+        assert (aref.ax, aref.ay, aref.bx, aref.by) == pytest.approx((20, 0, 0, 10))
+        assert dummy_device.get_port("in").x0 == pytest.approx(5.0)
+
+    def test_pool_key_survives_pickling(self, dummy_device: smdev.Device) -> None:
+        g = dummy_device.run()
+        pool = pickle.loads(pickle.dumps(samplemaker._DevicePool))  # noqa: S301
+
+        assert pool[dummy_device._pool_key()] == g.group[0].cellname
+
     def test_name_and_params_affect_hash(self, dummy_device: smdev.Device) -> None:
         h1 = hash(dummy_device)
         dummy_device.set_param("width", 20.0)
@@ -312,6 +359,64 @@ class TestDevice:
         assert isinstance(g.group[0], sp.Poly)
 
 
+class _CountingCachedDevice(dm.DummyDevice):
+    geom_calls = 0
+
+    @smdev.cached_geom(maxsize=2)
+    def geom(self) -> GeomGroup:
+        type(self).geom_calls += 1
+        return super().geom()
+
+
+class TestCachedGeom:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> None:
+        _CountingCachedDevice.geom.cache_clear()
+        _CountingCachedDevice.geom_calls = 0
+
+    def test_repeated_parameters_hit_cache(self) -> None:
+        dev = _CountingCachedDevice.build()
+        g1 = dev.geom()
+        g2 = dev.geom()
+
+        assert _CountingCachedDevice.geom_calls == 1
+        assert g1 is not g2
+        assert g1.group[0].data == pytest.approx(g2.group[0].data)
+
+    def test_returned_geometry_is_a_copy(self) -> None:
+        dev = _CountingCachedDevice.build()
+        dev.geom().translate(100, 100)
+        g = dev.geom()
+
+        assert g.bounding_box().llx == pytest.approx(0.0)
+
+    def test_changed_parameter_misses_cache(self) -> None:
+        dev = _CountingCachedDevice.build()
+        dev.geom()
+        dev.set_param("width", 20.0)
+        g = dev.geom()
+
+        assert _CountingCachedDevice.geom_calls == 2
+        assert g.bounding_box().width == pytest.approx(20.0)
+
+    def test_local_ports_restored_on_hit(self) -> None:
+        _CountingCachedDevice.build().geom()
+        dev = _CountingCachedDevice.build()
+        dev.use_references = False
+        dev.run()
+
+        assert _CountingCachedDevice.geom_calls == 1
+        assert "in" in dev._ports
+
+    def test_oldest_entry_evicted(self) -> None:
+        dev = _CountingCachedDevice.build()
+        for width in (10.0, 20.0, 30.0, 10.0):
+            dev.set_param("width", width)
+            dev.geom()
+
+        assert _CountingCachedDevice.geom_calls == 4
+
+
 class TestNetListEntry:
     def test_rotation_mapping(self) -> None:
         assert smdev.NetListEntry("A", 0, 0, "E", {}, {}).rot == 0
@@ -324,6 +429,14 @@ class TestNetListEntry:
         e2 = smdev.NetListEntry("A", 0, 0, "E", {"p": "w"}, {"x": 2})
         assert hash(e1) != hash(e2)
 
+    def test_equal_entries_compare_equal(self) -> None:
+        e1 = smdev.NetListEntry("A", 0, 0, "E", {"p": "w"}, {"x": 1})
+        e2 = smdev.NetListEntry("A", 0, 0, "E", {"p": "w"}, {"x": 1})
+        e3 = smdev.NetListEntry("A", 0, 0, "N", {"p": "w"}, {"x": 1})
+        assert e1 == e2
+        assert hash(e1) == hash(e2)
+        assert e1 != e3
+
 
 class TestNetList:
     def test_setters_update_internal_state(self) -> None:
@@ -399,6 +512,23 @@ class TestCircuit:
         assert "dev_TESTLIB_DUMMY_CONNECTOR_1" in circuit._p
         assert "dev_TESTLIB_DUMMY_CONNECTOR_2" in circuit._p
 
+    def test_run_shares_cell_between_equal_netlists(
+        self,
+        dummy_device_list: dict[str, type[smdev.Device]],
+        simple_netlist: smdev.NetList,
+    ) -> None:
+        _ = dummy_device_list
+        netlist_copy = smdev.NetList("simple", list(simple_netlist.entry_list))
+        c1 = smdev.Circuit.build()
+        c1.set_param("NETLIST", simple_netlist)
+        c2 = smdev.Circuit.build()
+        c2.set_param("NETLIST", netlist_copy)
+
+        g1 = c1.run()
+        g2 = c2.run()
+
+        assert g1.group[0].cellname == g2.group[0].cellname
+
     def test_run_connects_two_compatible_ports(
         self,
         dummy_device_list: dict[str, type[smdev.Device]],
@@ -189,6 +189,28 @@ class TestMarkerSet:
         assert aref.bx == 0
         assert aref.by == pytest.approx(ydist)
 
+    @pytest.mark.parametrize(("mset", "nrows"), [(2, 1), (4, 2)])
+    def test_markerset_get_geom_aref_follows_device_placement(
+        self, mset: int, nrows: int
+    ) -> None:
+        dev = CrossMark.build()
+        dev.set_position(3, 4)
+        dev.set_angle(90)
+        markerset = smlay.MarkerSet("TestMarkerSet", dev, 10, 20, mset, 200, 300)
+        single = smlay.MarkerSet("TestMarkerSet", dev, 10, 20, 1).get_geom()
+
+        g = markerset.get_geom()
+        aref = g.group[0]
+        # Same origin and orientation as a single marker at the same place
+        assert isinstance(aref, ARef)
+        assert (aref.x0, aref.y0) == pytest.approx((13, 24))
+        assert (aref.x0, aref.y0) == pytest.approx(
+            (single.group[0].x0, single.group[0].y0)
+        )
+        assert aref.angle == pytest.approx(90)
+        assert (aref.ncols, aref.nrows) == (2, nrows)
+        assert (aref.ax, aref.ay, aref.bx, aref.by) == pytest.approx((200, 0, 0, 300))
+
 
 class TestDeviceTableAnnotations:
     def test_annotations_init_defaults(self) -> None:
@@ -724,6 +746,23 @@ class TestMask:
         assert writer.calls[1][0] == "write_pool"
         assert writer.calls[2] == ("close_library", None)
 
+    def test_export_gds_resolves_deferred_unions(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(smlay, "GDSWriter", FakeGDSWriter)
+
+        themask = smlay.Mask("test_export")
+        dev = CrossMark.build()
+        themask.add_to_main_cell(dev.run())
+        cell = LayoutPool[_DevicePool[dev._pool_key()]]
+        assert len(cell.group) == 6
+
+        themask.export_gds()
+
+        # The two inner rectangles are merged into a single cross
+        assert len(cell.group) == 5
+        assert not any(geom._union_deferred for geom in cell.group)
+
     def test_export_gds_cache_success_uses_reader_cache_and_exports_cache(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
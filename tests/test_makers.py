@@ -462,6 +462,15 @@ def test_make_rect_noncenter_numkey() -> None:
     assert bb.height == pytest.approx(4.0)
 
 
+def test_make_rect_closed_counterclockwise_data() -> None:
+    poly = sm.make_rect(2.0, 3.0, 8.0, 4.0, numkey=9).group[0]
+
+    assert poly.Npts == 5
+    assert list(poly.data) == pytest.approx(
+        [-6.0, -1.0, 2.0, -1.0, 2.0, 3.0, -6.0, 3.0, -6.0, -1.0]
+    )
+
+
 def test_make_rounded_rect() -> None:
     rounded_rect_geom = sm.make_rounded_rect(
         x0=0.0,
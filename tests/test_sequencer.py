@@ -478,6 +478,34 @@ class TestSequencer:
         ):
             sequencer.run()
 
+    def test_run_validates_sequence_before_executing(self) -> None:
+        seq = [["STATE", "x", 5], ["INVALID_CMD"]]
+        sequencer = FakeSequencer(seq)
+        with pytest.raises(ValueError, match=r"Command INVALID_CMD does not exist."):
+            sequencer.run()
+
+        assert sequencer.calls == []
+        assert sequencer.state["x"] == 0
+
+    def test_run_compiles_sequence_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        sequencer = FakeSequencer([["STATE", "x", 5]])
+        compiles = []
+        compile_seq = sequencer._compile
+
+        def counting_compile() -> list:
+            compiles.append(1)
+            return compile_seq()
+
+        monkeypatch.setattr(sequencer, "_compile", counting_compile)
+        sequencer.run()
+        sequencer.run()
+        assert compiles == [1]
+
+        sequencer.seq = [["STATE", "y", 10]]
+        sequencer.run()
+        assert compiles == [1, 1]
+        assert sequencer.state["y"] == 10
+
     def test_run_centers_geom_and_coords_after_sequence(self) -> None:
         seq = [["ADD_RECT", 2, 3]]
         sequencer = FakeSequencer(seq)
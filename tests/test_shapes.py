@@ -337,6 +337,15 @@ class TestPoly:
     def test_centroid(self, poly_obj: sp.Poly) -> None:
         assert poly_obj.centroid() == pytest.approx((1.5, 1.0))
 
+    def test_xy_is_view_of_data(self, poly_obj: sp.Poly) -> None:
+        xy = poly_obj.xy
+
+        assert xy.shape == (poly_obj.Npts, 2)
+        np.testing.assert_array_equal(xy[:, 0], poly_obj.data[0::2])
+        np.testing.assert_array_equal(xy[:, 1], poly_obj.data[1::2])
+        xy[0] = (-5.0, -6.0)
+        assert list(poly_obj.data[:2]) == [-5.0, -6.0]
+
     def test_translate(self, poly_obj: sp.Poly) -> None:
         poly_obj.translate(1.0, 2.0)
         assert poly_obj.centroid() == pytest.approx((2.5, 3.0))
@@ -1279,6 +1288,60 @@ class TestRing:
         assert poly.layer == ring_obj.layer
         assert poly.Npts == 27
 
+    def test_to_polygon_rotated(self, ring_obj: sp.Ring) -> None:
+        expected = ring_obj.to_polygon(npts=12).group[0]
+        expected.rotate(ring_obj.x0, ring_obj.y0, 30)
+        ring_obj.rot += 30
+
+        poly = ring_obj.to_polygon(npts=12).group[0]
+
+        np.testing.assert_allclose(poly.data, expected.data, atol=1e-12)
+
+    def test_to_polygon_cached_reuses_result(self, ring_obj: sp.Ring) -> None:
+        g1 = ring_obj.to_polygon_cached(npts=12)
+        g2 = ring_obj.to_polygon_cached(npts=12)
+
+        assert g1 is g2
+        np.testing.assert_allclose(
+            g1.group[0].data, ring_obj.to_polygon(npts=12).group[0].data
+        )
+
+    def test_to_polygon_cached_invalidated_on_change(self, ring_obj: sp.Ring) -> None:
+        g1 = ring_obj.to_polygon_cached(npts=12)
+        ring_obj.translate(1, 0)
+        g2 = ring_obj.to_polygon_cached(npts=12)
+
+        assert g1 is not g2
+        np.testing.assert_allclose(
+            g2.group[0].data, ring_obj.to_polygon(npts=12).group[0].data
+        )
+        assert ring_obj.to_polygon_cached(npts=16).group[0].Npts == 35
+
+    def test_to_polygon_cached_shared_between_equal_shapes(
+        self, ring_obj: sp.Ring, arc_obj: sp.Arc
+    ) -> None:
+        # Rebuilding a device creates new objects with the same values
+        rebuilt = sp.Ring(x0=1.0, y0=2.0, rx=3.0, ry=2.0, layer=4, rot=0.0, w=1.0)
+
+        assert rebuilt.to_polygon_cached(12) is ring_obj.to_polygon_cached(12)
+        assert arc_obj.to_polygon_cached(12) is not ring_obj.to_polygon_cached(12)
+
+    def test_to_polygon_cached_drops_oldest_entries(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(sp, "_RingPolygonCache", {})
+        monkeypatch.setattr(sp, "_RING_POLYGON_CACHE_SIZE", 2)
+        rings = [
+            sp.Ring(x0=x, y0=0, rx=3.0, ry=2.0, layer=4, rot=0.0, w=1.0)
+            for x in range(3)
+        ]
+        first = rings[0].to_polygon_cached(12)
+        for ring in rings[1:]:
+            ring.to_polygon_cached(12)
+
+        assert len(sp._RingPolygonCache) == 2
+        assert rings[0].to_polygon_cached(12) is not first
+
 
 class TestArc:
     def test_init_arc(self, arc_obj: sp.Arc) -> None:
@@ -1322,6 +1385,16 @@ class TestArc:
         poly_ypts = poly.data[1::2]
         assert np.all(poly_ypts >= arc_obj.y0)
 
+    def test_to_polygon_cached_invalidated_on_angle(self, arc_obj: sp.Arc) -> None:
+        g1 = arc_obj.to_polygon_cached(npts=16)
+        arc_obj.a2 = 90.0
+        g2 = arc_obj.to_polygon_cached(npts=16)
+
+        assert g1 is not g2
+        np.testing.assert_allclose(
+            g2.group[0].data, arc_obj.to_polygon(npts=16).group[0].data
+        )
+
     def test_to_polygon_autosplit(self, arc_obj: sp.Arc) -> None:
         n_segments = 8
         g = arc_obj.to_polygon(npts=n_segments, autosplit=True)
@@ -1361,6 +1434,53 @@ class TestGeomGroup:
         assert g.group[0] is circle_obj
         assert g.group[1] is ellipse_obj
 
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ("translate", (1.5, -2.0)),
+            ("rotate_translate", (1.5, -2.0, 33.0)),
+            ("rotate", (1.0, 2.0, -71.0)),
+            ("scale", (1.0, 2.0, 0.5, 3.0)),
+            ("mirror_x", (1.0,)),
+            ("mirror_y", (-2.0,)),
+        ],
+    )
+    # Small and large groups take the per-element and batched paths respectively
+    @pytest.mark.parametrize("n_extra", [0, 20])
+    def test_group_transform_matches_elements(
+        self,
+        method: str,
+        args: tuple[float, ...],
+        n_extra: int,
+        circle_obj: sp.Circle,
+    ) -> None:
+        g = sp.GeomGroup()
+        g.add(sp.Poly([0, 1, 1], [0, 0, 2], 1))
+        g.add(circle_obj)
+        g.add(sp.Poly([3, 4, 4, 3], [3, 3, 5, 5], 2))
+        for i in range(n_extra):
+            g.add(sp.Poly([i, i + 1, i], [0, 0, i + 1], 1))
+        expected = g.copy()
+
+        getattr(g, method)(*args)
+        for geom in expected.group:
+            getattr(geom, method)(*args)
+
+        for geom, ref in zip(g.group, expected.group, strict=True):
+            if isinstance(geom, sp.Poly):
+                np.testing.assert_allclose(geom.data, ref.data)
+        assert g.group[1].x0 == pytest.approx(expected.group[1].x0)
+        assert g.group[1].y0 == pytest.approx(expected.group[1].y0)
+
+    def test_group_transform_repeated_poly(self) -> None:
+        poly = sp.Poly([0, 1, 1], [0, 0, 1], 1)
+        g = sp.GeomGroup()
+        g.add(poly)
+        g.add(poly)
+
+        g.translate(1, 0)
+        np.testing.assert_allclose(poly.data[0::2], [2, 3, 3, 2])
+
     def test_copy_geomgroup(self, circle_obj: sp.Circle) -> None:
         # Geometry copy creates a deep copy of the geometry, so that modifying the copy
         # does not affect the original.
@@ -1808,6 +1928,61 @@ class TestGeomGroup:
         assert res_poly.perimeter() == pytest.approx(10.0)
         assert res_poly.centroid() == pytest.approx((1.5, 1.0))
 
+    def test_boolean_union_deferred_merges_on_resolve(self) -> None:
+        layer = 6
+        g = sp.Box(0.0, 0.0, 2.0, 2.0).to_rect() + sp.Box(1.0, 0.0, 2.0, 2.0).to_rect()
+        g.set_layer(layer)
+        other = sp.Box(10.0, 0.0, 1.0, 1.0).to_rect()
+        other.set_layer(layer)
+        g += other
+
+        g.boolean_union_deferred(layer)
+        g += sp.Box(10.5, 0.0, 1.0, 1.0).to_rect().set_layer(layer)
+        assert len(g.group) == 4
+
+        sp.resolve_deferred_unions([g])
+
+        assert len(g.group) == 3
+        assert g.get_area() == pytest.approx(8.0)
+        assert {geom.layer for geom in g.group} == {layer}
+        areas = sorted(geom.area() for geom in g.group)
+        assert areas == pytest.approx([1.0, 1.0, 6.0])
+
+    def test_resolve_deferred_unions_accepts_polys_without_flag(self) -> None:
+        # Polygons unpickled from caches written before deferred unions existed
+        g = sp.Box(0.0, 0.0, 2.0, 2.0).to_rect()
+        del g.group[0]._union_deferred
+
+        sp.resolve_deferred_unions([g])
+
+        assert len(g.group) == 1
+
+    def test_resolve_deferred_unions_merges_separate_requests(self) -> None:
+        g1 = sp.Box(0.0, 0.0, 2.0, 2.0).to_rect().boolean_union_deferred(0)
+        g2 = sp.Box(1.0, 0.0, 2.0, 2.0).to_rect().boolean_union_deferred(0)
+        g3 = sp.Box(1.0, 0.0, 2.0, 2.0).to_rect().set_layer(1)
+        g3.boolean_union_deferred(1)
+        g = g1 + g2 + g3
+
+        sp.resolve_deferred_unions([g])
+
+        assert len(g.group) == 2
+        assert g.select_layer(0).get_area() == pytest.approx(6.0)
+        assert g.select_layer(1).get_area() == pytest.approx(4.0)
+
+    def test_resolve_deferred_unions_keeps_groups_separate(self) -> None:
+        g1 = sp.Box(0.0, 0.0, 2.0, 2.0).to_rect() + sp.Box(1.0, 0.0, 2.0, 2.0).to_rect()
+        g2 = g1.copy()
+        g1.boolean_union_deferred(0)
+        g2.boolean_union_deferred(0)
+
+        sp.resolve_deferred_unions([g1, g2])
+
+        assert len(g1.group) == 1
+        assert len(g2.group) == 1
+        assert g1.get_area() == pytest.approx(6.0)
+        assert g2.get_area() == pytest.approx(6.0)
+
     def test_boolean_difference_subtracts_polygon_set(self) -> None:
         layer_a = 1
         layer_b = 2
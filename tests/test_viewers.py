@@ -0,0 +1,212 @@
+"""Unit tests for the samplemaker.viewers module."""
+
+from collections.abc import Callable, Generator
+
+import matplotlib as mpl
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.collections import EllipseCollection, PolyCollection
+from matplotlib.colors import to_rgba_array
+
+import samplemaker.makers as sm
+import samplemaker.viewers as smv
+from samplemaker.baselib.devices import FocusingGratingCoupler
+from samplemaker.shapes import GeomGroup
+from tests import dummy as dm
+
+mpl.use("Agg")
+
+
+@pytest.fixture
+def view(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Generator[Callable[[GeomGroup], plt.Axes], None, None]:
+    """Return a function that displays a geometry and returns the axes used."""
+    monkeypatch.setattr(plt, "show", lambda: None)
+
+    def _view(grp: GeomGroup) -> plt.Axes:
+        smv.view_geometry(grp)
+        return plt.gca()
+
+    yield _view
+    plt.close("all")
+
+
+@pytest.fixture
+def mixed_geometry() -> GeomGroup:
+    grp = sm.make_rect(0, 0, 4, 2, layer=3)
+    grp += sm.make_rect(10, 0, 4, 2, layer=13)
+    grp += sm.make_path([0, 10, 10], [20, 20, 30], 0.5, layer=2)
+    grp += sm.make_circle(50, 0, 5, layer=1)
+    grp += sm.make_ellipse(0, -50, 8, 3, 30, layer=4)
+    grp += sm.make_ring(-40, 0, 6, 6, 0, 1, layer=5)
+    return grp
+
+
+def _collections(ax: plt.Axes) -> dict[type, list]:
+    found: dict[type, list] = {}
+    for coll in ax.collections:
+        found.setdefault(type(coll), []).append(coll)
+    return found
+
+
+def test_view_geometry_draws_one_collection_per_kind(
+    view: Callable[[GeomGroup], plt.Axes], mixed_geometry: GeomGroup
+) -> None:
+    ax = view(mixed_geometry)
+    found = _collections(ax)
+
+    assert len(found[PolyCollection]) == 2
+    assert len(found[EllipseCollection]) == 1
+    polys, paths = found[PolyCollection]
+    # Two rectangles and the ring converted to a polygon
+    assert len(polys.get_paths()) == 3
+    assert len(paths.get_paths()) == 1
+    assert len(found[EllipseCollection][0].get_offsets()) == 2
+
+
+def test_view_geometry_colors_follow_layer_modulo_ten(
+    view: Callable[[GeomGroup], plt.Axes], mixed_geometry: GeomGroup
+) -> None:
+    colors = mpl.rcParams["axes.prop_cycle"].by_key()["color"]
+    ax = view(mixed_geometry)
+    polys, paths = _collections(ax)[PolyCollection]
+    ellipses = _collections(ax)[EllipseCollection][0]
+
+    np.testing.assert_array_equal(
+        polys.get_facecolor(), to_rgba_array([colors[3], colors[3], colors[5]])
+    )
+    np.testing.assert_array_equal(paths.get_edgecolor(), to_rgba_array([colors[2]]))
+    np.testing.assert_array_equal(
+        ellipses.get_facecolor(), to_rgba_array([colors[1], colors[4]])
+    )
+
+
+def test_view_geometry_keeps_paths_open(
+    view: Callable[[GeomGroup], plt.Axes], mixed_geometry: GeomGroup
+) -> None:
+    ax = view(mixed_geometry)
+    _, paths = _collections(ax)[PolyCollection]
+
+    path = paths.get_paths()[0]
+    assert path.codes is None
+    np.testing.assert_array_equal(path.vertices, [[0, 20], [10, 20], [10, 30]])
+
+
+def test_view_geometry_data_limits_cover_full_circles(
+    view: Callable[[GeomGroup], plt.Axes],
+) -> None:
+    grp = sm.make_circle(50, 0, 5)
+    grp += sm.make_ellipse(0, -50, 8, 3, 0)
+    ax = view(grp)
+
+    lim = ax.dataLim
+    assert lim.x1 >= 55
+    assert lim.x0 <= -8
+    assert lim.y0 <= -58
+    assert lim.y1 >= 5
+
+
+def test_view_geometry_warns_on_text(
+    view: Callable[[GeomGroup], plt.Axes],
+) -> None:
+    grp = sm.make_text(0, 0, "A", 1, 0.1)
+    grp += sm.make_rect(0, 0, 1, 1)
+
+    with pytest.warns(UserWarning, match="text display is not supported"):
+        ax = view(grp)
+    assert len(_collections(ax)[PolyCollection]) == 1
+
+
+def test_view_geometry_draws_aref_outlines_on_lattice(
+    view: Callable[[GeomGroup], plt.Axes],
+) -> None:
+    dev = dm.DummyDevice.build()
+    dev.set_position(5, -2)
+    grp = dev.as_aref(3, 2, 20, 10)
+    ax = view(grp)
+
+    (refs,) = _collections(ax)[PolyCollection]
+    assert refs.get_linestyle()[0][1] is not None  # dashed
+    paths = refs.get_paths()
+    assert len(paths) == 6
+    # Outline of the 10x5 rectangle, centered vertically on the device origin
+    lower_left = sorted(tuple(p.vertices.min(axis=0)) for p in paths)
+    expected = sorted((5 + 20 * i, -4.5 + 10 * j) for i in range(3) for j in range(2))
+    np.testing.assert_allclose(lower_left, expected)
+    for p in paths:
+        np.testing.assert_allclose(np.ptp(p.vertices, axis=0), [10, 5])
+
+
+@pytest.fixture
+def inspected_path_device(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Generator[None, None, None]:
+    monkeypatch.setattr(plt, "show", lambda: None)
+    smv.inspect_device(dm.DummyPathDevice)
+    yield
+    plt.close("all")
+
+
+@pytest.mark.usefixtures("inspected_path_device")
+def test_slider_change_keeps_paths_open() -> None:
+    coll = smv._ViewerCurrentCollections["path"]
+    assert coll.get_paths()[0].codes is None
+
+    slider = smv._ViewerCurrentSliders[0]
+    slider.set_val(slider.val * 2)
+
+    assert smv._ViewerCurrentCollections["path"] is coll
+    assert len(coll.get_paths()[0].vertices) == 3
+    assert coll.get_paths()[0].vertices[1, 0] == pytest.approx(20.0)
+    assert coll.get_paths()[0].codes is None
+
+
+@pytest.fixture
+def inspected_grating_coupler(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Generator[None, None, None]:
+    monkeypatch.setattr(plt, "show", lambda: None)
+    smv.inspect_device(FocusingGratingCoupler)
+    yield
+    plt.close("all")
+
+
+@pytest.mark.usefixtures("inspected_grating_coupler")
+def test_integer_parameters_get_integer_sliders() -> None:
+    dev = smv._ViewerCurrentDevice
+    int_sliders = [
+        slider
+        for slider, param in zip(smv._ViewerCurrentSliders, dev._p, strict=True)
+        if dev._ptype[param] is int
+    ]
+
+    assert {s.label.get_text() for s in int_sliders} >= {"order", "nr_Apo"}
+    for slider in int_sliders:
+        assert slider.valstep == 1
+        assert isinstance(slider.valmax, int)
+
+
+@pytest.mark.usefixtures("inspected_grating_coupler")
+def test_equal_quantized_slider_value_does_not_rebuild(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    dev = smv._ViewerCurrentDevice
+    runs = []
+    run = dev.run
+
+    def counting_run() -> GeomGroup:
+        runs.append(1)
+        return run()
+
+    monkeypatch.setattr(dev, "run", counting_run)
+    slider = smv._ViewerCurrentSliders[list(dev._p).index("order")]
+
+    slider.set_val(slider.val)
+    slider.set_val(slider.val + 0.3)
+    assert runs == []
+
+    slider.set_val(round(slider.val) + 1)
+    assert runs == [1]
+    assert dev._p["order"] == round(slider.val)